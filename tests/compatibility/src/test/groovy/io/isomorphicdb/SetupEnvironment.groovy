@@ -1,19 +1,19 @@
 package io.isomorphicdb
 
-import com.zaxxer.hikari.HikariDataSource
 import groovy.sql.Sql
 import org.testcontainers.containers.JdbcDatabaseContainer
 import org.testcontainers.containers.PostgreSQLContainer
+import spock.lang.Shared
 import spock.lang.Specification
 
-import java.sql.SQLException
+import java.sql.BatchUpdateException
 
 class SetupEnvironment extends Specification {
   static final JdbcDatabaseContainer<PostgreSQLContainer> POSTGRE_SQL
+  private static final String PG_URL
+  private static final String DB_URL = "jdbc:postgresql://localhost:5432/test?gssEncMode=disable&sslmode=disable&preferQueryMode=extendedForPrepared"
 
   static {
-    Class.forName(Constants.DRIVER_CLASS);
-
     if (!Constants.CI) {
       println("Make sure that you are running database locally")
       POSTGRE_SQL = new PostgreSQLContainer("postgres:$Constants.VERSION")
@@ -26,26 +26,24 @@ class SetupEnvironment extends Specification {
     } else {
       POSTGRE_SQL = null
     }
-  }
 
-  static Map<String, String> pgConf() {
-    [
-        url     : pgUrl(),
-        user    : Constants.USER,
-        password: Constants.PASSWORD,
-        driver  : Constants.DRIVER_CLASS
-    ]
+    PG_URL = pgUrl()
   }
 
-  static Map<String, String> dbConf() {
-    [
-        url     : "jdbc:postgresql://localhost:5432/test?gssEncMode=disable&sslmode=disable&preferQueryMode=extendedForPrepared",
-        user    : Constants.USER,
-        password: Constants.PASSWORD,
-        driver  : Constants.DRIVER_CLASS,
-    ]
+  @Shared
+  protected Sql pg
+  @Shared
+  protected Sql db
+
+  def setupSpec() {
+    pg = Sql.newInstance(PG_URL, Constants.USER, Constants.PASSWORD, Constants.DRIVER_CLASS)
+    db = Sql.newInstance(DB_URL, Constants.USER, Constants.PASSWORD, Constants.DRIVER_CLASS)
   }
 
+  def cleanupSpec() {
+    pg?.close()
+    db?.close()
+  }
 
   private static String pgUrl() {
     if (Constants.CI) {
@@ -55,43 +53,43 @@ class SetupEnvironment extends Specification {
     }
   }
 
-  static pgExecute(String query) {
-    execute(pgConf(), query)
+  def pgExecute(String query) {
+    execute(pg, query)
   }
 
-  static pgExecute(String query, List<Object> params) {
-    execute(pgConf(), query, params)
+  def pgExecute(String query, List<Object> params) {
+    execute(pg, query, params)
   }
 
-  static dbExecute(String query) {
-    execute(dbConf(), query)
+  def pgExecute(List<String> queries) {
+    execute(pg, queries)
   }
 
-  static dbExecute(String query, List<Object> params) {
-    execute(dbConf(), query, params)
+  def dbExecute(String query) {
+    execute(db, query)
   }
 
-  private static execute(Map<String, String> conf, String query) {
-    Sql.withInstance(conf) {
-      Sql sql -> sql.execute query
-    }
+  def dbExecute(String query, List<Object> params) {
+    execute(db, query, params)
   }
 
-  private static execute(Map<String, String> conf, String query, List<Object> params) {
-    Sql.withInstance(conf) {
-      Sql sql -> sql.execute query, params
-    }
+  def dbExecute(List<String> queries) {
+    execute(db, queries)
+  }
+
+  private static execute(Sql sql, String query) {
+    sql.execute query
+  }
+
+  private static execute(Sql sql, String query, List<Object> params) {
+    sql.execute query, params
   }
 
-  static void withInstance(HikariDataSource source, Closure c) throws SQLException {
-    Sql sql = null;
+  private static execute(Sql sql, List<String> queries) {
     try {
-      sql = new Sql(source);
-      c.call(sql);
-    } finally {
-      if (sql != null) {
-        sql.close()
-      }
+      sql.withBatch { statement -> queries.each { query -> statement.addBatch query } }
+    } catch (BatchUpdateException e) {
+      throw e.nextException ?: e
     }
   }
 }
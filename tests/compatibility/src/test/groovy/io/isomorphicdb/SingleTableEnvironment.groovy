@@ -0,0 +1,29 @@
+package io.isomorphicdb
+
+abstract class SingleTableEnvironment extends SetupEnvironment {
+  private static final String CREATE_SCHEMA = 'create schema SCHEMA_NAME'
+  private static final String DELETE_ALL_ROWS = 'delete from SCHEMA_NAME.TABLE_NAME'
+  private static final String DROP_SCHEMA_CASCADE = 'drop schema if exists SCHEMA_NAME cascade'
+  protected static final String SELECT_ALL_QUERY = 'select * from SCHEMA_NAME.TABLE_NAME'
+
+  protected abstract String createTableQuery()
+
+  def setupSpec() {
+    pgExecute([CREATE_SCHEMA, createTableQuery()])
+    dbExecute([CREATE_SCHEMA, createTableQuery()])
+  }
+
+  def cleanupSpec() {
+    if (pg != null) {
+      pgExecute(DROP_SCHEMA_CASCADE)
+    }
+    if (db != null) {
+      dbExecute(DROP_SCHEMA_CASCADE)
+    }
+  }
+
+  def cleanup() {
+    pgExecute(DELETE_ALL_ROWS)
+    dbExecute(DELETE_ALL_ROWS)
+  }
+}
@@ -9,19 +9,15 @@ org.postgresql.util.PSQLException: This connection has been closed.
 should be fixed with extended query RFC implementation
 ''')
 class BasicQueryOperationsSpec extends ThreeSmallIntColumnTable {
-  private static String INSERT_QUERY = 'insert into SCHEMA_NAME.TABLE_NAME values (?, ?, ?)'
+  private static final String INSERT_QUERY = 'insert into SCHEMA_NAME.TABLE_NAME values (?, ?, ?)'
+  private static final List<List<Integer>> ROWS = [[1, 2, 3], [4, 5, 6], [7, 8, 9]]
 
   private int pgInserts = 0
   private int dbInserts = 0
 
   def setup() {
-    pgInserts += pg.executeUpdate INSERT_QUERY, [1, 2, 3]
-    pgInserts += pg.executeUpdate INSERT_QUERY, [4, 5, 6]
-    pgInserts += pg.executeUpdate INSERT_QUERY, [7, 8, 9]
-
-    dbInserts += db.executeUpdate INSERT_QUERY, [1, 2, 3]
-    dbInserts += db.executeUpdate INSERT_QUERY, [4, 5, 6]
-    dbInserts += db.executeUpdate INSERT_QUERY, [7, 8, 9]
+    pgInserts += pg.withBatch(INSERT_QUERY) { ps -> ROWS.each { row -> ps.addBatch row } }.sum()
+    dbInserts += db.withBatch(INSERT_QUERY) { ps -> ROWS.each { row -> ps.addBatch row } }.sum()
   }
 
   def 'insert select{all}'() {
@@ -6,9 +6,13 @@ import java.sql.SQLException
 
 class WorkingWithSchemasSpec extends SetupEnvironment {
   def cleanupSpec() {
-    dbExecute 'drop schema if exists CREATE_SCHEMA_TEST'
-    dbExecute 'drop schema if exists CREATE_SCHEMA_IF_NOT_EXIST'
-    dbExecute 'drop schema if exists WITH_THE_SAME_NAME'
+    if (db != null) {
+      dbExecute([
+          'drop schema if exists CREATE_SCHEMA_TEST',
+          'drop schema if exists CREATE_SCHEMA_IF_NOT_EXIST',
+          'drop schema if exists WITH_THE_SAME_NAME'
+      ])
+    }
   }
 
   def 'create schema'() {
@@ -4,13 +4,12 @@ import groovy.sql.GroovyRowResult
 import io.isomorphicdb.ThreeSmallIntColumnTable
 
 class BasicQueryOperationsSpec extends ThreeSmallIntColumnTable {
-  def 'insert select{all}'() {
-    given:
-      String insertQuery = 'insert into SCHEMA_NAME.TABLE_NAME values (1, 2, 3), (4, 5, 6), (7, 8, 9)'
+  private static final String INSERT_QUERY = 'insert into SCHEMA_NAME.TABLE_NAME values (1, 2, 3), (4, 5, 6), (7, 8, 9)'
 
+  def 'insert select{all}'() {
     when:
-      int pgInserts = pg.executeUpdate insertQuery
-      int dbInserts = db.executeUpdate insertQuery
+      int pgInserts = pg.executeUpdate INSERT_QUERY
+      int dbInserts = db.executeUpdate INSERT_QUERY
     and:
       List<GroovyRowResult> pgSelect = pg.rows SELECT_ALL_QUERY
       List<GroovyRowResult> dbSelect = db.rows SELECT_ALL_QUERY
@@ -25,12 +24,11 @@ class BasicQueryOperationsSpec extends ThreeSmallIntColumnTable {
 
   def 'insert select{listed column}'() {
     given:
-      String insertQuery = 'insert into SCHEMA_NAME.TABLE_NAME values (1, 2, 3), (4, 5, 6), (7, 8, 9)'
       String selectQuery = 'select col1, col2, col3 from SCHEMA_NAME.TABLE_NAME'
 
     when:
-      int pgInserts = pg.executeUpdate insertQuery
-      int dbInserts = db.executeUpdate insertQuery
+      int pgInserts = pg.executeUpdate INSERT_QUERY
+      int dbInserts = db.executeUpdate INSERT_QUERY
     and:
       List<GroovyRowResult> pgSelect = pg.rows selectQuery
       List<GroovyRowResult> dbSelect = db.rows selectQuery
@@ -45,12 +43,11 @@ class BasicQueryOperationsSpec extends ThreeSmallIntColumnTable {
 
   def 'insert select{some values}'() {
     given:
-      String insertQuery = 'insert into SCHEMA_NAME.TABLE_NAME values (1, 2, 3), (4, 5, 6), (7, 8, 9)'
       String selectQuery = 'select col1, col2, col3 from SCHEMA_NAME.TABLE_NAME where col1 > 1'
 
     when:
-      int pgInserts = pg.executeUpdate insertQuery
-      int dbInserts = db.executeUpdate insertQuery
+      int pgInserts = pg.executeUpdate INSERT_QUERY
+      int dbInserts = db.executeUpdate INSERT_QUERY
     and:
       List<GroovyRowResult> pgSelect = pg.rows selectQuery
       List<GroovyRowResult> dbSelect = db.rows selectQuery
@@ -65,11 +62,10 @@ class BasicQueryOperationsSpec extends ThreeSmallIntColumnTable {
 
   def 'insert update{all} select{all}'() {
     given:
-      String insertQuery = 'insert into SCHEMA_NAME.TABLE_NAME values (1, 2, 3), (4, 5, 6), (7, 8, 9)'
       String updateQuery = 'update SCHEMA_NAME.TABLE_NAME set col1 = 10, col2 = 11, col3 = 12'
     and:
-      pg.executeUpdate insertQuery
-      db.executeUpdate insertQuery
+      pg.executeUpdate INSERT_QUERY
+      db.executeUpdate INSERT_QUERY
 
     when:
       int pgUpdates = pg.executeUpdate updateQuery
@@ -88,11 +84,10 @@ class BasicQueryOperationsSpec extends ThreeSmallIntColumnTable {
 
   def 'insert update{some} select{all}'() {
     given:
-      String insertQuery = 'insert into SCHEMA_NAME.TABLE_NAME values (1, 2, 3), (4, 5, 6), (7, 8, 9)'
       String updateQuery = 'update SCHEMA_NAME.TABLE_NAME set col1 = 10, col2 = 11, col3 = 12 where col1 = 2'
     and:
-      pg.executeUpdate insertQuery
-      db.executeUpdate insertQuery
+      pg.executeUpdate INSERT_QUERY
+      db.executeUpdate INSERT_QUERY
 
     when:
       int pgUpdates = pg.executeUpdate updateQuery
@@ -111,11 +106,10 @@ class BasicQueryOperationsSpec extends ThreeSmallIntColumnTable {
 
   def 'insert delete{all} select{all}'() {
     given:
-      String insertQuery = 'insert into SCHEMA_NAME.TABLE_NAME values (1, 2, 3), (4, 5, 6), (7, 8, 9)'
       String deleteQuery = 'delete from SCHEMA_NAME.TABLE_NAME'
     and:
-      pg.executeUpdate insertQuery
-      db.executeUpdate insertQuery
+      pg.executeUpdate INSERT_QUERY
+      db.executeUpdate INSERT_QUERY
 
     when:
       int pgDeletes = pg.executeUpdate deleteQuery
@@ -134,11 +128,10 @@ class BasicQueryOperationsSpec extends ThreeSmallIntColumnTable {
 
   def 'insert delete{some} select{all}'() {
     given:
-      String insertQuery = 'insert into SCHEMA_NAME.TABLE_NAME values (1, 2, 3), (4, 5, 6), (7, 8, 9)'
       String deleteQuery = 'delete from SCHEMA_NAME.TABLE_NAME where col1 > 4'
     and:
-      pg.executeUpdate insertQuery
-      db.executeUpdate insertQuery
+      pg.executeUpdate INSERT_QUERY
+      db.executeUpdate INSERT_QUERY
 
     when:
       int pgDeletes = pg.executeUpdate deleteQuery
@@ -14,8 +14,12 @@ class WorkingWithTablesSpec extends SetupEnvironment {
   }
 
   def cleanupSpec() {
-    pgExecute(DROP_SCHEMA)
-    dbExecute(DROP_SCHEMA)
+    if (pg != null) {
+      pgExecute(DROP_SCHEMA)
+    }
+    if (db != null) {
+      dbExecute(DROP_SCHEMA)
+    }
   }
 
   def 'create table in non existent schema'() {
@@ -1,40 +1,20 @@
 package io.isomorphicdb.types
 
 import groovy.sql.GroovyRowResult
-import groovy.sql.Sql
-import io.isomorphicdb.SetupEnvironment
+import io.isomorphicdb.SingleTableEnvironment
 import spock.lang.Unroll
 
-class BooleanConstraintsChecksSpec extends SetupEnvironment {
-  private static final String CREATE_SCHEMA = 'create schema SCHEMA_NAME'
+class BooleanConstraintsChecksSpec extends SingleTableEnvironment {
   private static final String CREATE_TABLE =
       """
-          create table SCHEMA_NAME.TABLE_NAME (
+          create unlogged table SCHEMA_NAME.TABLE_NAME (
               BOOL_COL boolean
           )
 """
-  private static final String DROP_SCHEMA_CASCADE = 'drop schema SCHEMA_NAME cascade'
-  private static final String SELECT_ALL_QUERY = 'select * from SCHEMA_NAME.TABLE_NAME'
 
-  protected Sql pg
-  protected Sql db
-
-  def setup() {
-    pgExecute(CREATE_SCHEMA)
-    pgExecute(CREATE_TABLE)
-    dbExecute(CREATE_SCHEMA)
-    dbExecute(CREATE_TABLE)
-
-    pg = Sql.newInstance(pgConf())
-    db = Sql.newInstance(dbConf())
-  }
-
-  def cleanup() {
-    pgExecute(DROP_SCHEMA_CASCADE)
-    dbExecute(DROP_SCHEMA_CASCADE)
-
-    pg.close()
-    db.close()
+  @Override
+  protected String createTableQuery() {
+    CREATE_TABLE
   }
 
   @Unroll
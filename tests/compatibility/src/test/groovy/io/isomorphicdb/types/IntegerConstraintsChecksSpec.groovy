@@ -1,57 +1,37 @@
 package io.isomorphicdb.types
 
 import groovy.sql.GroovyRowResult
-import groovy.sql.Sql
-import io.isomorphicdb.SetupEnvironment
+import io.isomorphicdb.SingleTableEnvironment
 import spock.lang.Unroll
 
 import java.sql.SQLException
 
-class IntegerConstraintsChecksSpec extends SetupEnvironment {
-  private static final String CREATE_SCHEMA = 'create schema SCHEMA_NAME'
+class IntegerConstraintsChecksSpec extends SingleTableEnvironment {
   private static final String CREATE_TABLE =
       """
-          create table SCHEMA_NAME.TABLE_NAME (
+          create unlogged table SCHEMA_NAME.TABLE_NAME (
               SI_COL smallint,
               I__COL integer,
               BI_COL bigint
           )
 """
-  private static final String DROP_SCHEMA_CASCADE = 'drop schema SCHEMA_NAME cascade'
-  private static final String SELECT_ALL_QUERY = 'select * from SCHEMA_NAME.TABLE_NAME'
 
-  protected Sql pg
-  protected Sql db
-
-  def setup() {
-    pgExecute(CREATE_SCHEMA)
-    pgExecute(CREATE_TABLE)
-    dbExecute(CREATE_SCHEMA)
-    dbExecute(CREATE_TABLE)
-
-    pg = Sql.newInstance(pgConf())
-    db = Sql.newInstance(dbConf())
-  }
-
-  def cleanup() {
-    pgExecute(DROP_SCHEMA_CASCADE)
-    dbExecute(DROP_SCHEMA_CASCADE)
-
-    pg.close()
-    db.close()
+  @Override
+  protected String createTableQuery() {
+    CREATE_TABLE
   }
 
   def 'integer types min max limits'() {
     given:
-      String insertMaxValues = 'insert into SCHEMA_NAME.TABLE_NAME values ( 32767,  2147483647,  9223372036854775807)'
-      String insertMinValues = 'insert into SCHEMA_NAME.TABLE_NAME values (-32768, -2147483648, -9223372036854775808)'
+      String insertMaxMinValues = '''
+    insert into SCHEMA_NAME.TABLE_NAME
+    values  ( 32767,  2147483647,  9223372036854775807),
+            (-32768, -2147483648, -9223372036854775808)
+'''
 
     when:
-      pg.executeUpdate insertMaxValues
-      db.executeUpdate insertMaxValues
-    and:
-      pg.executeUpdate insertMinValues
-      db.executeUpdate insertMinValues
+      pg.executeUpdate insertMaxMinValues
+      db.executeUpdate insertMaxMinValues
     and:
       List<GroovyRowResult> pgSelect = pg.rows SELECT_ALL_QUERY
       List<GroovyRowResult> dbSelect = db.rows SELECT_ALL_QUERY
@@ -63,67 +43,37 @@ class IntegerConstraintsChecksSpec extends SetupEnvironment {
   }
 
   @Unroll
-  def '#type out of range error'() {
+  def '#type #error'() {
     given:
-      String outOfRange = "insert into SCHEMA_NAME.TABLE_NAME ($column, ${others[0]}, ${others[1]}) values ($value, 0, 0)"
+      String insertQuery = "insert into SCHEMA_NAME.TABLE_NAME ($column, ${others[0]}, ${others[1]}) values ($value, 0, 0)"
 
     when:
-      SQLException pgOutOfRange = null
-      try {
-        pg.execute outOfRange
-      } catch(SQLException e) {
-        pgOutOfRange = e
-      }
-    and:
-      SQLException dbOutOfRange = null
-      try {
-        db.execute outOfRange
-      } catch(SQLException e) {
-        dbOutOfRange = e
-      }
-
-    then:
-      println "PG ERROR: ${pgOutOfRange.inspect()}"
-      println "DB ERROR: ${dbOutOfRange.inspect()}"
-    and:
-      pgOutOfRange.errorCode == dbOutOfRange.errorCode
-
-    where:
-      type << ['smallint', 'integer', 'bigint']
-      column << ['SI_COL', 'I__COL', 'BI_COL']
-      others << [['I__COL', 'BI_COL'], ['SI_COL', 'BI_COL'], ['SI_COL', 'I__COL']]
-      value << [32768, 2147483648, 9223372036854775808]
-  }
-
-  @Unroll
-  def '#type type mismatch'() {
-    given:
-      String typeMismatch = "insert into SCHEMA_NAME.TABLE_NAME ($column, ${others[0]}, ${others[1]}) values ('this is a string', 0, 0)"
-    when:
-      SQLException pgMismatch = null
+      SQLException pgError = null
       try {
-        pg.execute typeMismatch
+        pg.execute insertQuery
       } catch(SQLException e) {
-        pgMismatch = e
+        pgError = e
       }
     and:
-      SQLException dbMismatch = null
+      SQLException dbError = null
       try {
-        db.execute typeMismatch
+        db.execute insertQuery
       } catch(SQLException e) {
-        dbMismatch = e
+        dbError = e
       }
 
     then:
-      println "PG ERROR: ${pgMismatch.inspect()}"
-      println "DB ERROR: ${dbMismatch.inspect()}"
+      println "PG ERROR: ${pgError.inspect()}"
+      println "DB ERROR: ${dbError.inspect()}"
     and:
-      pgMismatch.errorCode == dbMismatch.errorCode
+      pgError.errorCode == dbError.errorCode
 
     where:
-      type << ['smallint', 'integer', 'bigint']
-      column << ['SI_COL', 'I__COL', 'BI_COL']
-      others << [['I__COL', 'BI_COL'], ['SI_COL', 'BI_COL'], ['SI_COL', 'I__COL']]
+      type << ['smallint', 'integer', 'bigint'] * 2
+      column << ['SI_COL', 'I__COL', 'BI_COL'] * 2
+      others << [['I__COL', 'BI_COL'], ['SI_COL', 'BI_COL'], ['SI_COL', 'I__COL']] * 2
+      error << ['out of range error'] * 3 + ['type mismatch'] * 3
+      value << [32768, 2147483648, 9223372036854775808] + ["'this is a string'"] * 3
   }
 
   def 'update with columns of different types'() {
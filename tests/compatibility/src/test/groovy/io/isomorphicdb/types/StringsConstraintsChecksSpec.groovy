@@ -1,18 +1,16 @@
 package io.isomorphicdb.types
 
 import groovy.sql.GroovyRowResult
-import groovy.sql.Sql
-import io.isomorphicdb.SetupEnvironment
+import io.isomorphicdb.SingleTableEnvironment
 import spock.lang.Ignore
 import spock.lang.Unroll
 
 import java.sql.SQLException
 
-class StringsConstraintsChecksSpec extends SetupEnvironment {
-  private static final String CREATE_SCHEMA = 'create schema SCHEMA_NAME'
+class StringsConstraintsChecksSpec extends SingleTableEnvironment {
   private static final String CREATE_TABLE =
       """
-          create table SCHEMA_NAME.TABLE_NAME (
+          create unlogged table SCHEMA_NAME.TABLE_NAME (
               C____COL char,
               C__1_COL char(1),
               C__5_COL char(5),
@@ -21,28 +19,10 @@ class StringsConstraintsChecksSpec extends SetupEnvironment {
               VC_5_COL varchar(5)
           )
 """
-  private static final String DROP_SCHEMA_CASCADE = 'drop schema SCHEMA_NAME cascade'
-  private static final String SELECT_ALL_QUERY = 'select * from SCHEMA_NAME.TABLE_NAME'
 
-  protected Sql pg
-  protected Sql db
-
-  def setup() {
-    pgExecute(CREATE_SCHEMA)
-    pgExecute(CREATE_TABLE)
-    dbExecute(CREATE_SCHEMA)
-    dbExecute(CREATE_TABLE)
-
-    pg = Sql.newInstance(pgConf())
-    db = Sql.newInstance(dbConf())
-  }
-
-  def cleanup() {
-    pgExecute(DROP_SCHEMA_CASCADE)
-    dbExecute(DROP_SCHEMA_CASCADE)
-
-    pg.close()
-    db.close()
+  @Override
+  protected String createTableQuery() {
+    CREATE_TABLE
   }
 
   @Ignore("isomorphicdb treats defaults and whitespace strings differently")
@@ -3,13 +3,7 @@ package io.isomorphicdb
 import groovy.sql.Sql
 import spock.lang.Specification
 
-import java.sql.SQLException
-
 class SecureConnection extends Specification {
-  static {
-    Class.forName(Constants.DRIVER_CLASS);
-  }
-
   static Map<String, String> dbConf() {
     [
         url     : "jdbc:postgresql://localhost:5432/test?gssEncMode=disable&sslmode=require&preferQueryMode=extendedForPrepared",
@@ -19,13 +13,13 @@ class SecureConnection extends Specification {
     ]
   }
 
-  static dbExecute(String query) {
-    execute(dbConf(), query)
+  static dbExecute(List<String> queries) {
+    execute(dbConf(), queries)
   }
 
-  private static execute(Map<String, String> conf, String query) {
+  private static execute(Map<String, String> conf, List<String> queries) {
     Sql.withInstance(conf) {
-      Sql sql -> sql.execute query
+      Sql sql -> queries.each { query -> sql.execute query }
     }
   }
 
@@ -34,15 +28,9 @@ class SecureConnection extends Specification {
 
   def 'create schema'() {
     when:
-      SQLException dbError
-      try {
-        dbExecute(CREATE_SCHEMA)
-        dbExecute(DROP_SCHEMA_CASCADE)
-      } catch (SQLException e) {
-        dbError = e
-      }
+      dbExecute([CREATE_SCHEMA, DROP_SCHEMA_CASCADE])
 
     then:
-      dbError == null
+      noExceptionThrown()
   }
 }